@@ -60,10 +60,10 @@ CSI_100 = Exchange(
     name="CSI_100",
     url='https://en.wikipedia.org/wiki/CSI_100_Index',
     table_number=3,
-    pattern_and_replacement=(
-        r'^(SSE:\s*(\d+)|SZSE:\s*(\d+))$',
-        lambda m: f"{m.group(2)}.SS" if m.group(2) else f"{m.group(3)}.SZ"
-    ),
+    pattern_and_replacement=[
+        (r'^SSE:\s*(\d+)$', r'\1.SS'),
+        (r'^SZSE:\s*(\d+)$', r'\1.SZ')
+    ],
     column_key='Ticker',
     filename='symbols_csi_100.csv'
 )
@@ -72,10 +72,10 @@ CSI_300 = Exchange(
     name='CSI_300',
     url='https://en.wikipedia.org/wiki/CSI_300_Index',
     table_number=3,
-    pattern_and_replacement=(
-        r'^(SSE:\s*(\d+)|SZSE:\s*(\d+))$',
-        lambda m: f"{m.group(2)}.SS" if m.group(2) else f"{m.group(3)}.SZ"
-    ),
+    pattern_and_replacement=[
+        (r'^SSE:\s*(\d+)$', r'\1.SS'),
+        (r'^SZSE:\s*(\d+)$', r'\1.SZ')
+    ],
     column_key='Ticker',
     filename='symbols_csi_300.csv'
 )
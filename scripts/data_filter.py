@@ -1,48 +1,61 @@
 import pandas as pd
 from src.utils.paths import RAW_DATA_DIR, INTERIM_DATA_DIR, PROCESSED_DATA_DIR
+from src.utils.file_io import CSV_ENGINE, DATA_FORMAT, DATA_FORMATS
 import numpy as np
 
 
-def filename_to_series(filename: str, column_name: str, date_format: str='%d %b %y', read_dir="raw") -> pd.Series:   # alternative date_format='%Y-%m-%d'
-    if read_dir == "raw":
-        _read_dir = RAW_DATA_DIR
-    elif read_dir == "interim":
-        _read_dir = INTERIM_DATA_DIR
-    elif read_dir == "processed":
-        _read_dir = PROCESSED_DATA_DIR
-    else:
-        raise ValueError('The write directory must be one of "raw", "interim" or "processed".')
+_DATA_DIRS = {"raw": RAW_DATA_DIR, "interim": INTERIM_DATA_DIR, "processed": PROCESSED_DATA_DIR}
+
+
+def filename_to_series(filename: str, column_name: str, date_format: str='%d %b %y', read_dir="raw", file_format: str=DATA_FORMAT) -> pd.Series:   # alternative date_format='%Y-%m-%d'
+    try:
+        _read_dir = _DATA_DIRS[read_dir]
+    except KeyError:
+        raise ValueError('The read directory must be one of "raw", "interim" or "processed".')
+    if file_format not in DATA_FORMATS:
+        raise ValueError(f"file_format must be one of {DATA_FORMATS}")
     # Create filepath specifying CSV location
     filepath = _read_dir / filename
-    # Construct dataframe
-    df = pd.read_csv(filepath)
-    df['Date'] = pd.to_datetime(df["Date"], format=date_format)
-    df.index = df["Date"]
+    # save_series swaps the suffix for Parquet, so look for that file first (raw files are always CSV)
+    parquet_filepath = filepath.with_suffix(".parquet")
+    if filepath.suffix == ".parquet" or (file_format == "parquet" and parquet_filepath.exists()):
+        # Parquet keeps the Date index and its dtype, so no date parsing is needed
+        df = pd.read_parquet(parquet_filepath, columns=[column_name])
+    else:
+        # Read only the date and requested columns, parsing dates straight into the index
+        df = pd.read_csv(filepath, usecols=["Date", column_name], parse_dates=["Date"],
+                         date_format=date_format, index_col="Date", engine=CSV_ENGINE)
+    # read_csv leaves unparseable dates as strings rather than raising
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise ValueError(f'Dates in {filepath} do not match format {date_format}')
     series = df[column_name]
     return series
 
 
 def filter_series(*args: tuple[pd.Series]) -> tuple[pd.Series]:
-    df = pd.concat(args, axis=1)
+    # Inner join keeps only the common dates (sorted, as the previous outer join returned them),
+    # dropna then removes missing values within them
+    df = pd.concat(args, axis=1, join="inner", sort=True)
     df = df.dropna()
-    filtered_tuple_of_series = tuple(pd.Series(df.iloc[:,i]) for i in range(df.shape[1]))
+    filtered_tuple_of_series = tuple(df.iloc[:,i] for i in range(df.shape[1]))
     return filtered_tuple_of_series
 
 
-def save_series(series: pd.Series, filename: str, write_dir="interim") -> None:
-    if write_dir not in ["raw", "interim", "processed"]:
-        raise ValueError('The write directory must be one of "raw", "interim" or "processed".')
+def save_series(series: pd.Series, filename: str, write_dir="interim", file_format: str=DATA_FORMAT) -> None:
     # Specify the write directory (as defined in ./src/utils/paths.py)
-    if write_dir == "interim":
-        _write_dir = INTERIM_DATA_DIR
-    if write_dir == "processed":
-        _write_dir = PROCESSED_DATA_DIR
-    if write_dir == "raw":
-        _write_dir = RAW_DATA_DIR
-    # If series is a pd.Series instance, write to CSV
+    try:
+        _write_dir = _DATA_DIRS[write_dir]
+    except KeyError:
+        raise ValueError('The write directory must be one of "raw", "interim" or "processed".')
+    if file_format not in DATA_FORMATS:
+        raise ValueError(f"file_format must be one of {DATA_FORMATS}")
+    # If series is a pd.Series instance, write to CSV (or Parquet)
     if isinstance(series, pd.Series):
         filepath = _write_dir / filename
-        series.to_csv(filepath)
+        if file_format == "parquet":
+            series.to_frame().to_parquet(filepath.with_suffix(".parquet"), compression="zstd")
+        else:
+            series.to_csv(filepath)
 
 
 # ---------------------------------------------------------------------------------
@@ -1,29 +1,109 @@
 # src/data_acquisition/exchange.py
 from dataclasses import dataclass
-from typing import List, Tuple
+from io import StringIO
+from typing import Dict, List, Optional, Set, Tuple, Union
 import pandas as pd
+import json
+import os
 import re
-import yfinance as yf
+import threading
 import time
+from src.utils.file_io import write_csv
 from src.utils.logger import get_logger
 from src.utils.paths import RAW_DATA_DIR
 
 logger = get_logger(__name__)
 
+# Wikipedia footnote markers, e.g. [1] or its URL-encoded form %5B1%5D
+_SUPERSCRIPT_RE = re.compile(r'(?:%5B\d+%5D|\[\d+\])')
+
+# Plausible yf ticker, e.g. AAPL, BRK.B, HSBA.L, 600519.SS
+_TICKER_RE = re.compile(r'^[A-Z0-9]{1,8}(?:\.[A-Z]{1,2})?$')
+
+# yf download errors that mean the symbol itself is unknown, as opposed to network or rate-limit failures
+_NOT_FOUND_RE = re.compile(r'delisted|not found|no (?:price )?data found|no timezone found', re.IGNORECASE)
+
+# Persistent yf validation results shared by all exchanges: {ticker: [exists, timestamp]}
+_TICKER_CACHE_FILEPATH = RAW_DATA_DIR / '.ticker_cache.json'
+_ticker_cache: Optional[Dict[str, list]] = None
+_ticker_cache_lock = threading.Lock()
+
+# HTTP session shared by all exchanges, created on first use
+_session = None
+_session_lock = threading.Lock()
+
+# yf.download collects results in module-level state, so concurrent calls must not overlap
+_yf_download_lock = threading.Lock()
+
+
+def _load_ticker_cache() -> Dict[str, list]:
+    """Load the ticker validation cache from disk on first use."""
+    global _ticker_cache
+    with _ticker_cache_lock:
+        if _ticker_cache is None:
+            try:
+                _ticker_cache = json.loads(_TICKER_CACHE_FILEPATH.read_text())
+            except (FileNotFoundError, json.JSONDecodeError):
+                _ticker_cache = {}
+    return _ticker_cache
+
+
+def _save_ticker_cache() -> None:
+    """Write the ticker validation cache back to disk."""
+    with _ticker_cache_lock:
+        _TICKER_CACHE_FILEPATH.write_text(json.dumps(_ticker_cache))
+
+
+def _get_session():
+    """Return the shared keep-alive `requests.Session`, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            _session = requests.Session()
+            _session.headers.update({'User-Agent': 'short-term-contrarian', 'Accept-Encoding': 'gzip'})
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+    return _session
+
 
 @dataclass
 class Exchange:
-    """Represents a stock exchange and provides methods to fetch and validate stock symbols."""
+    """Represents a stock exchange and provides methods to fetch and validate stock symbols.
+
+    `pattern_and_replacement` is either a single (pattern, replacement) pair or a
+    list of pairs applied in order, e.g. one pair per listing venue.
+
+    With `validate_with_yf=False`, tickers are only checked against a local
+    format regex and no yfinance requests are made.
+    """
     name: str
     url: str
     table_number: int
-    pattern_and_replacement: Tuple[str]
+    pattern_and_replacement: Union[Tuple[str, str], List[Tuple[str, str]]]
     column_key: str
     filename: str
+    validation_ttl_days: float = 7
+    max_workers: int = 16
+    validate_with_yf: bool = True
 
     def __post_init__(self):
-        """Post-initialization hook for logging."""
-        logger.debug(f'Initialised Exchange instance for {self.name}')
+        """Post-initialization hook for logging and compiling the ticker patterns."""
+        pairs = self.pattern_and_replacement
+        if isinstance(pairs, tuple):
+            pairs = [pairs]
+        self._replacements = [(re.compile(pattern), repl) for pattern, repl in pairs]
+        logger.debug('Initialised Exchange instance for %s', self.name)
+
+
+    @property
+    def validated_filename(self) -> str:
+        """Filename of the cached yf-validated symbols, e.g. symbols_djia.validated.csv"""
+        root, ext = os.path.splitext(self.filename)
+        return f'{root}.validated{ext}'
 
 
     def get_symbols(self) -> List[str]:
@@ -35,20 +115,36 @@ class Exchange:
         logger.info('Getting symbols')
         logger.debug('Specifying filepath directory/filename')
         filepath = RAW_DATA_DIR / self.filename
-        
-        # Check if the file already exists to avoid redundant downloads
+        validated_filepath = RAW_DATA_DIR / self.validated_filename
+
+        # Reuse the validated symbols if they are younger than the TTL and were derived from
+        # the current raw file, so that deleting or replacing the raw file forces a refresh
+        if filepath.exists() and validated_filepath.exists():
+            validated_mtime = os.path.getmtime(validated_filepath)
+            if validated_mtime < os.path.getmtime(filepath):
+                logger.debug("Validated symbols in %s predate %s", validated_filepath, filepath)
+            elif time.time() - validated_mtime < self.validation_ttl_days * 86400:
+                logger.info(f"Loading validated symbols from cached file: {validated_filepath}")
+                df = pd.read_csv(validated_filepath)
+                return df[self.column_key].tolist()
+            else:
+                logger.debug("Validated symbols in %s are stale", validated_filepath)
+
+        # Check if the file already exists to avoid redundant downloads; its tickers
+        # still go through validation since the validated file is missing or stale
         if filepath.exists():
-            logger.debug(f"Filepath {filepath} exists")
+            logger.debug("Filepath %s exists", filepath)
             logger.info(f"Loading symbols from cached file: {filepath}")
             logger.debug('Attempting to pd.read_csv(filepath)')
             df = pd.read_csv(filepath)
-            stock_tickers = df[self.column_key].tolist()
-            return stock_tickers
+            stock_tickers = df[self.column_key].astype(str).tolist()
+            return self.validate_symbols(stock_tickers)
 
         # If filename does not exist, download data using `url`
         try:
             logger.info(f"Fetching stock symbols from {self.url}")
-            tables = pd.read_html(self.url)
+            html = self.fetch_html()
+            tables = pd.read_html(StringIO(html), flavor='lxml')
         except ValueError as e:
             logger.error(f"Could not find table info at {self.url}: {e}")
             return []
@@ -64,39 +160,195 @@ class Exchange:
 
         # Process symbols
         logger.debug("Converting tickers' formats into the yf style")
-        logger.debug(f"Available table keys = {table.keys}")
-        pattern, repl = self.pattern_and_replacement
-        table[self.column_key] = [re.sub(pattern, repl, x) for x in table[self.column_key].values]
-        table[self.column_key] = [re.sub(r'(%5B\d+%5D|\[\d+\])', '', x) for x in table[self.column_key].values]
+        logger.debug("Available table keys = %s", list(table.columns))
+        column = table[self.column_key].astype(str)
+        for pattern, repl in self._replacements:
+            column = column.str.replace(pattern, repl, regex=True)
+        column = column.str.replace(_SUPERSCRIPT_RE, '', regex=True)
+        table[self.column_key] = column
         self.table = table
 
         # Save raw table to CSV
-        logger.info(f'Saving table to_csv({filepath}, index=False)')
-        self.table.to_csv(filepath, index=False)
+        logger.info(f'Saving table write_csv({filepath})')
+        write_csv(self.table, filepath)
+
+        stock_tickers = table[self.column_key].tolist()
+        return self.validate_symbols(stock_tickers)
+
+
+    def validate_symbols(self, stock_tickers: List[str]) -> List[str]:
+        """Mask invalid tickers and cache the result as the validated symbols file.
+
+        Args:
+            stock_tickers (List[str]): Ticker symbols in the yf style
+
+        Returns:
+            List[str]: The tickers, with invalid ones replaced by 'invalid_ticker'
+        """
+        validated_filepath = RAW_DATA_DIR / self.validated_filename
+
+        # Reject malformed tickers locally, before any network call
+        well_formed = [ticker for ticker in stock_tickers if _TICKER_RE.match(ticker)]
+        if not self.validate_with_yf:
+            logger.info('Skipping yf validation, only the ticker format was checked')
+            well_formed = set(well_formed)
+            return [ticker if ticker in well_formed else 'invalid_ticker' for ticker in stock_tickers]
 
         # Validate tickers with yf
         logger.debug('Validating tickers with yf')
-        stock_tickers = table[self.column_key].values
-        stock_tickers = [ticker if self.ticker_exists(ticker) else 'invalid_ticker' for ticker in stock_tickers]
+        valid_tickers, unresolved_tickers = self.valid_tickers(well_formed)
+        stock_tickers = [ticker if ticker in valid_tickers else 'invalid_ticker' for ticker in stock_tickers]
+
+        # Save validated tickers to CSV; the file's mtime doubles as the validation timestamp.
+        # Tickers yf could not check (network errors, rate limits) are masked in this result
+        # only, and the file is not written so the next run retries them.
+        if unresolved_tickers:
+            logger.warning(f'{len(unresolved_tickers)} tickers could not be checked with yf, not caching {validated_filepath}')
+        else:
+            logger.info(f'Saving validated tickers to_csv({validated_filepath}, index=False)')
+            pd.Series(stock_tickers, name=self.column_key).to_csv(validated_filepath, index=False)
         return stock_tickers
 
 
-    def ticker_exists(self, ticker_symbol: str) -> bool:
-        """Check if a ticker symbol is recognized by yfinance.
-        
+    def fetch_html(self) -> str:
+        """Fetch the page at `url`, reusing the HTML cached in RAW_DATA_DIR when unchanged.
+
+        The ETag and Last-Modified headers of the previous response are kept in a
+        sidecar JSON file and sent back as a conditional request, so an unchanged
+        page costs a 304 response instead of a full download. Requests go through
+        a shared keep-alive session so that TLS connections are reused.
+
+        Returns:
+            str: The HTML of the page
+        """
+        html_filepath = RAW_DATA_DIR / f'{self.name}.html'
+        headers_filepath = RAW_DATA_DIR / f'{self.name}.html.json'
+
+        request_headers = {}
+        if html_filepath.exists() and headers_filepath.exists():
+            cached_headers = json.loads(headers_filepath.read_text())
+            if cached_headers.get('ETag'):
+                request_headers['If-None-Match'] = cached_headers['ETag']
+            if cached_headers.get('Last-Modified'):
+                request_headers['If-Modified-Since'] = cached_headers['Last-Modified']
+
+        response = _get_session().get(self.url, headers=request_headers, timeout=10)
+        if response.status_code == 304:
+            logger.info(f"Page unchanged, loading HTML from cached file: {html_filepath}")
+            return html_filepath.read_text(encoding='utf-8')
+        response.raise_for_status()
+
+        logger.debug('Caching HTML to %s', html_filepath)
+        html_filepath.write_text(response.text, encoding='utf-8')
+        headers_filepath.write_text(json.dumps({
+            'ETag': response.headers.get('ETag'),
+            'Last-Modified': response.headers.get('Last-Modified')
+        }))
+        return response.text
+
+
+    def valid_tickers(self, ticker_symbols: List[str]) -> Tuple[Set[str], Set[str]]:
+        """Return the ticker symbols recognised by yfinance, and those that could not be checked.
+
+        Results younger than `validation_ttl_days` are taken from the on-disk ticker
+        cache, which is shared across exchanges; only the remaining symbols are
+        checked with yfinance. Only definite answers are cached: a ticker is stored
+        as missing only when yfinance reported it as not found.
+
         Args:
-            ticker_symbol (str): The ticker symbol to validate
+            ticker_symbols (List[str]): The ticker symbols to validate
 
         Returns:
-            bool: True if the ticker is valid, False otherwise
+            Tuple[Set[str], Set[str]]: The valid ticker symbols, and the unresolved ones
         """
+        cache = _load_ticker_cache()
+        now = time.time()
+        max_age = self.validation_ttl_days * 86400
+
+        unique_tickers = list(dict.fromkeys(ticker_symbols))
+        valid = set()
+        unknown = []
+        for ticker in unique_tickers:
+            entry = cache.get(ticker)
+            if entry is not None and now - entry[1] < max_age:
+                if entry[0]:
+                    valid.add(ticker)
+            else:
+                unknown.append(ticker)
+        logger.debug('%d of %d tickers found in the ticker cache', len(unique_tickers) - len(unknown), len(unique_tickers))
+
+        unresolved = set()
+        if unknown:
+            result = self.download_valid_tickers(unknown)
+            if result is None:
+                unresolved.update(unknown)
+            else:
+                downloaded, not_found = result
+                with _ticker_cache_lock:
+                    for ticker in downloaded:
+                        cache[ticker] = [True, now]
+                    for ticker in not_found:
+                        cache[ticker] = [False, now]
+                _save_ticker_cache()
+                valid |= downloaded
+                unresolved.update(set(unknown) - downloaded - not_found)
+        return valid, unresolved
+
+
+    def download_valid_tickers(self, ticker_symbols: List[str]) -> Optional[Tuple[Set[str], Set[str]]]:
+        """Check which ticker symbols are recognised by yfinance.
+
+        All symbols are downloaded in a single batched `yf.download` call, fanned
+        out over `max_workers` threads; a ticker is considered valid when its
+        price history is non-empty. `yf.download` does not raise on per-ticker
+        failures, so a ticker is only reported as not found when yfinance's error
+        for it says so; any other failure leaves it unresolved.
+
+        Args:
+            ticker_symbols (List[str]): The ticker symbols to validate
+
+        Returns:
+            Optional[Tuple[Set[str], Set[str]]]: The valid and the not-found ticker symbols,
+            or None if the download failed or resolved none of the tickers
+        """
+        import yfinance as yf
+        from yfinance import shared as yf_shared
+
         try:
-            logger.debug('Checking if ticker symbol is recognised by yf')
-            ticker = yf.Ticker(ticker_symbol)
-            logger.debug(f'ticker.info = {ticker.info}')
-            time.sleep(0.1)
-            return bool(ticker.info)
+            logger.debug('Downloading recent prices for %d tickers with yf', len(ticker_symbols))
+            with _yf_download_lock:
+                data = yf.download(
+                    list(ticker_symbols),
+                    period='5d',
+                    group_by='ticker',
+                    threads=self.max_workers,
+                    progress=False,
+                    auto_adjust=False
+                )
+                # Per-ticker errors of the last download, keyed by ticker symbol
+                errors = dict(getattr(yf_shared, '_ERRORS', {}))
         except Exception as e:
-            logger.error(f'yf ticker check resulted in an exception: {e}')
-            return False
+            logger.error(f'yf batch download resulted in an exception: {e}')
+            return None
+
+        # A single ticker may come back without the ticker level in the columns
+        if not isinstance(data.columns, pd.MultiIndex):
+            valid = set(ticker_symbols) if not data.dropna(how='all').empty else set()
+        else:
+            downloaded = set(data.columns.get_level_values(0))
+            valid = {
+                ticker for ticker in ticker_symbols
+                if ticker in downloaded and not data[ticker].dropna(how='all').empty
+            }
+
+        not_found = {
+            ticker for ticker in ticker_symbols
+            if ticker not in valid and _NOT_FOUND_RE.search(str(errors.get(ticker, '')))
+        }
 
+        # Neither data nor a not-found error for any ticker most likely means yf was
+        # unreachable or rate limited
+        if not valid and not not_found:
+            logger.error(f'yf returned no data for any of the {len(ticker_symbols)} tickers, nothing is cached')
+            return None
+        return valid, not_found
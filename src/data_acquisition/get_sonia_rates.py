@@ -1,25 +1,48 @@
 # src/data_acquisition/get_sonia_rates.py
 from src.utils.logger import get_logger
 from pathlib import Path
-import pandas as pd
 from src.utils.paths import RAW_DATA_DIR
+from src.utils.file_io import CSV_ENGINE
 
 logger = get_logger(__name__)
 
-filepath = RAW_DATA_DIR / "sonia_raw.csv"
-logger.debug(f'Defining filepath {filepath}')
+BOE_DATABASE_URL = "https://www.bankofengland.co.uk/boeapps/database/fromshowcolumns.asp"
 
 
-if filepath.exists():
-    logger.debug('Checked that filepath exists')
-    print("SONIA rates were manually downloaded from the Bank of England website:")
-    print("https://www.bankofengland.co.uk/boeapps/database/fromshowcolumns.asp")
-    print(f"and stored in `{RAW_DATA_DIR}` with filename sonia_raw.csv")
+def load_sonia(filepath: Path = RAW_DATA_DIR / "sonia_raw.csv", date_format: str = "%d %b %y"):
+    """Read the SONIA rates that were manually downloaded from the Bank of England website.
+
+    Args:
+        filepath (Path): Location of the raw SONIA CSV file
+        date_format (str): Date format string for parsing the Date column
+
+    Returns:
+        pd.DataFrame: The Date and SONIA columns, with dates parsed
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the dates do not match date_format
+    """
+    logger.debug('Defining filepath %s', filepath)
+    if not filepath.exists():
+        logger.error(f'Filepath {filepath} to not exist, raising a FileNotFoundError.')
+        raise FileNotFoundError(f"The file {filepath.name} was not found in the directory: {filepath.parent}. It needs to be obtained manually from the Bank of England website: {BOE_DATABASE_URL}")
+
     logger.debug('Trying to read filepath using pandas -> dataframe')
-    data = pd.read_csv(filepath)
-else:
-    logger.error(f'Filepath {filepath} to not exist, raising a FileNotFoundError.')
-    raise FileNotFoundError(f"The file sonia_raw.csv was not found in the directory: {RAW_DATA_DIR}. It needs to be obtained manually from the Bank of England website: https://www.bankofengland.co.uk/boeapps/database/fromshowcolumns.asp")
+    import pandas as pd
+    from pandas.api.types import is_datetime64_any_dtype
+    df = pd.read_csv(filepath, usecols=["Date", "SONIA"], parse_dates=["Date"],
+                     date_format=date_format, engine=CSV_ENGINE)
+    # read_csv leaves unparseable dates as strings rather than raising
+    if not is_datetime64_any_dtype(df["Date"]):
+        raise ValueError(f"Dates in {filepath} do not match format {date_format}")
+    return df
+
 
-logger.info('Printing SONIA.csv to stdout')
-print(data)
+if __name__ == "__main__":
+    data = load_sonia()
+    print("SONIA rates were manually downloaded from the Bank of England website:")
+    print(BOE_DATABASE_URL)
+    print(f"and stored in `{RAW_DATA_DIR}` with filename sonia_raw.csv")
+    logger.info('Printing SONIA.csv to stdout')
+    print(data)
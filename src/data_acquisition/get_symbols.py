@@ -3,35 +3,39 @@ from src.utils.logger import get_logger
 from src.utils.paths import RAW_DATA_DIR
 from config.exchanges import EXCHANGES
 import argparse
-import pandas as pd
-from datetime import datetime
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import List, Dict, Optional
-import re
-import yfinance as yf
 
 logger = get_logger(__name__)
 
 
-def get_all_symbols() -> Dict[str, List[str]]:
+def get_all_symbols(validate_with_yf: bool = True) -> Dict[str, List[str]]:
     """Get symbols for all configured exchanges.
     
+    Args:
+        validate_with_yf (bool): Whether to validate the symbols with yfinance
+
     Returns:
         Dict[str, List[str]]: Dictionary mapping exchange names to their symbol lists
     """
-    results = {}
-    for name, exchange in EXCHANGES.items():
-        logger.info(f"Fetching symbols for {name}")
-        symbols = exchange.get_symbols()
-        results[name] = symbols
+    # Exchanges are independent and write to distinct files, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=len(EXCHANGES)) as executor:
+        futures = {}
+        for name, exchange in EXCHANGES.items():
+            logger.info(f"Fetching symbols for {name}")
+            exchange = replace(exchange, validate_with_yf=validate_with_yf)
+            futures[name] = executor.submit(exchange.get_symbols)
+        results = {name: future.result() for name, future in futures.items()}
     return results
 
 
-def get_exchange_symbols(exchange_name: str) -> Optional[List[str]]:
+def get_exchange_symbols(exchange_name: str, validate_with_yf: bool = True) -> Optional[List[str]]:
     """Get symbols for a specific exchange.
     
     Args:
         exchange_name (str): Name of the exchange to fetch symbols from
+        validate_with_yf (bool): Whether to validate the symbols with yfinance
 
     Returns:
         Optional[List[str]]: List of symbols if exchange exists, None otherwise
@@ -41,7 +45,7 @@ def get_exchange_symbols(exchange_name: str) -> Optional[List[str]]:
         logger.error(f"Exchange {exchange_name} not found. Available exchanges: {available}")
         return None
     
-    exchange = EXCHANGES[exchange_name]
+    exchange = replace(EXCHANGES[exchange_name], validate_with_yf=validate_with_yf)
     return exchange.get_symbols()
 
 
@@ -58,7 +62,10 @@ def main():
         2. Fetch symbols from all configured exchanges:
            $ python src/data_acquisition/get_symbols.py --all
            
-        3. Display help and available options:
+        3. Fetch symbols without checking them against yfinance:
+           $ python src/data_acquisition/get_symbols.py -e DJIA --skip-validation
+
+        4. Display help and available options:
            $ python src/data_acquisition/get_symbols.py --help
     
     Python Usage:
@@ -73,6 +80,7 @@ def main():
     Options:
         -e, --exchange  Specify a single exchange to fetch symbols from
         -a, --all      Fetch symbols from all configured exchanges
+        --skip-validation  Only check the ticker format, without yfinance requests
         -h, --help     Show help message and exit
     
     Note:
@@ -86,16 +94,19 @@ def main():
     parser.add_argument('--all', '-a',
                       action='store_true',
                       help='Fetch symbols from all exchanges')
+    parser.add_argument('--skip-validation',
+                      action='store_true',
+                      help='Only check the ticker format, without yfinance requests')
     
     args = parser.parse_args()
     
     if args.all:
-        results = get_all_symbols()
+        results = get_all_symbols(validate_with_yf=not args.skip_validation)
         for exchange_name, symbols in results.items():
             print(f"\n{exchange_name} symbols:")
             print(symbols)
     elif args.exchange:
-        symbols = get_exchange_symbols(args.exchange)
+        symbols = get_exchange_symbols(args.exchange, validate_with_yf=not args.skip_validation)
         if symbols:
             print(f"\n{args.exchange} symbols:")
             print(symbols)
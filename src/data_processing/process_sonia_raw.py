@@ -1,6 +1,7 @@
 # src/data_processing/process_sonia_raw.py
 
 from src.utils.paths import RAW_DATA_DIR, INTERIM_DATA_DIR, PROCESSED_DATA_DIR
+from src.utils.file_io import CSV_ENGINE, DATA_FORMAT, DATA_FORMATS
 from pathlib import Path
 from typing import Union, Optional
 import pandas as pd
@@ -20,7 +21,8 @@ def process_sonia_raw(
     write_column_date_name: str = "Date",
     write_column_name: str = "SONIA",
     days_in_year: int = 252,
-    dropna: bool = True
+    dropna: bool = True,
+    file_format: str = DATA_FORMAT
 ) -> None:
     """
     Reads a CSV file containing SONIA (Sterling Overnight Index Average) rates, 
@@ -40,13 +42,16 @@ def process_sonia_raw(
         write_column_name (str): Name of the SONIA rate column in the output file
         days_in_year (int): Day count convention (e.g., 252 for business days, 365 for calendar days)
         dropna (bool): Whether to remove rows containing NaN values
+        file_format (str): Output file format, "csv" or "parquet" (Parquet replaces the
+            suffix of write_filename with .parquet)
     
     Returns:
         None
         
     Raises:
         FileNotFoundError: If the input file doesn't exist
-        ValueError: If the required columns are not found in the input file
+        ValueError: If the required columns are not found in the input file, or
+            file_format is not supported
         
     Example:
         >> example_data = pd.DataFrame({
@@ -65,26 +70,32 @@ def process_sonia_raw(
     read_dir = Path(read_dir)
     write_dir = Path(write_dir)
     
+    if file_format not in DATA_FORMATS:
+        raise ValueError(f"file_format must be one of {DATA_FORMATS}")
+    
     # Ensure input file exists
     read_filepath = read_dir / read_filename
     if not read_filepath.exists():
         raise FileNotFoundError(f"Input file not found: {read_filepath}")
     
-    # Read the CSV file
-    df = pd.read_csv(read_filepath)
-    
-    # Validate required columns exist
-    if read_column_date_name not in df.columns or read_column_name not in df.columns:
+    # Validate required columns exist (reads the header only)
+    columns = pd.read_csv(read_filepath, nrows=0).columns
+    if read_column_date_name not in columns or read_column_name not in columns:
         raise ValueError(f"Required columns {read_column_date_name} and/or {read_column_name} not found in input file")
     
     try:
-        # Convert dates to datetime
-        df[read_column_date_name] = pd.to_datetime(df[read_column_date_name], format=read_date_format)
-        
-        # Set index and name
-        df.index = df[read_column_date_name]
-        df.index = df.index.strftime(write_date_format)
-        df = df[[read_column_name]]  # Keep only the rate column
+        # Read only the date and rate columns, parsing dates straight into the index
+        df = pd.read_csv(
+            read_filepath,
+            usecols=[read_column_date_name, read_column_name],
+            parse_dates=[read_column_date_name],
+            date_format=read_date_format,
+            index_col=read_column_date_name,
+            engine=CSV_ENGINE
+        )
+        # read_csv leaves unparseable dates as strings rather than raising
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError(f"Dates in column {read_column_date_name} do not match format {read_date_format}")
         df.columns = [write_column_name]  # Rename the column
         
         # Convert annual rates to daily rates
@@ -100,7 +111,11 @@ def process_sonia_raw(
         
         # Save processed data
         write_filepath = write_dir / write_filename
-        daily_rates.to_csv(write_filepath)
+        if file_format == "parquet":
+            write_filepath = write_filepath.with_suffix(".parquet")
+            daily_rates.to_parquet(write_filepath, compression="zstd")
+        else:
+            daily_rates.to_csv(write_filepath, date_format=write_date_format)
         
         if write_filepath.exists() and write_filepath.is_file():
             print(f"The processed {daily_rates.columns[0]} file has been created.")
@@ -120,7 +135,8 @@ def annual_to_daily_rates(
     """
     Converts annual interest rates to daily compounding rates.
     
-    The conversion uses the formula: daily_rate = (1 + annual_rate)^(1/days_in_year) - 1
+    The conversion uses the formula: daily_rate = (1 + annual_rate)^(1/days_in_year) - 1,
+    computed as expm1(log1p(annual_rate) / days_in_year) for numerical accuracy
     
     Args:
         annual_rates (pd.DataFrame): DataFrame containing annual rates
@@ -146,19 +162,23 @@ def annual_to_daily_rates(
     if days_in_year <= 0 or not isinstance(days_in_year, int):
         raise ValueError("days_in_year must be positive")
         
-    # Create a copy to avoid modifying the input
-    rates = annual_rates.copy()
+    # Remove NaN values if specified (returns a new frame, the input is never modified)
+    rates = annual_rates.dropna() if dropna else annual_rates
     
-    # Remove NaN values if specified
-    if dropna:
-        rates = rates.dropna()
+    # Work on the underlying array to avoid materialising intermediate DataFrames
+    values = rates.to_numpy(dtype=np.float64, copy=False)
     
     # Convert from percentage to decimal if specified
     if convert_percentage_to_decimal:
-        rates = rates / 100
+        values = values / 100
         
-    # Convert to daily rates using the compound interest formula
-    daily_rates = (1 + rates) ** (1 / days_in_year) - 1
+    # Convert to daily rates using the compound interest formula, evaluated as
+    # expm1(log1p(r) / n) which is vectorised and accurate for small rates
+    daily_rates = pd.DataFrame(
+        np.expm1(np.log1p(values) / days_in_year),
+        index=rates.index,
+        columns=rates.columns
+    )
     
     return daily_rates
 
@@ -1,6 +1,6 @@
-import requests
-
 def i_am_online():
+    import requests
+
     try:
         response = requests.get("https://www.google.com", timeout=5)
         return True
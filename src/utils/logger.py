@@ -1,10 +1,113 @@
 # src/utils/logger.py
 
+import atexit
+import functools
 import logging
 import logging.handlers
 import os
-from pathlib import Path
-from datetime import datetime
+import queue
+import threading
+import time
+
+# None of the formatters use thread or process fields, so skip collecting them on every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats the %(asctime)s timestamp at most once per second.
+
+    Output matches logging.Formatter (e.g. 2025-02-06 13:57:57,687); the strftime
+    result for the current second is cached and only the milliseconds are
+    formatted per record.
+    """
+    _cache = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, cached_time = self._cache
+        if second != cached_second:
+            cached_time = time.strftime(self.default_time_format, self.converter(second))
+            self._cache = (second, cached_time)
+        return self.default_msec_format % (cached_time, record.msecs)
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that buffers writes instead of flushing after every record.
+
+    The log file is opened with a `buffer_size` write buffer. It is flushed straight
+    away for records at or above `flush_level`, and otherwise by a timer at most
+    `flush_interval` seconds after the first unflushed record.
+
+    Rollover is decided from a running count of the characters written, since
+    `stream.tell()` would flush the buffer on every record, and each record is
+    formatted only once rather than once for the rollover check and again to write.
+    """
+
+    def __init__(self, *args, buffer_size=65536, flush_level=logging.WARNING, flush_interval=0.5, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._flush_timer = None
+        self._written = 0
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._written = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        return self._exceeds_max_bytes(self.format(record) + self.terminator)
+
+    def _exceeds_max_bytes(self, msg):
+        # Only touch the filesystem once the in-memory count says the limit is reached;
+        # non-regular files (e.g. /dev/null) are never rolled over, as in the stdlib
+        if self.maxBytes <= 0 or not self._written or self._written + len(msg) < self.maxBytes:
+            return False
+        return os.path.isfile(self.baseFilename)
+
+    def emit(self, record):
+        try:
+            # Format once and reuse the message for both the rollover check and the write
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self._exceeds_max_bytes(msg):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._written += len(msg)
+            if record.levelno >= self.flush_level:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _timed_flush(self):
+        with self.lock:
+            self._flush_timer = None
+            self.flush()
+
+    def close(self):
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        super().close()
+
 
 class ProjectLogger:
     """Centralised logging configuration for the project.
@@ -18,6 +121,10 @@ class ProjectLogger:
         * Console output for INFO and above (for immediate feedback)
         * File output for DEBUG and above (for detailed troubleshooting)
     - Rotating Log Files: Automatically manages log file size and keeps backup files
+    - Background File Writes: File records are queued and written to disk by a listener
+      thread. The message itself (msg % args, tracebacks) is still rendered on the calling
+      thread by QueueHandler.prepare; only the file formatting and write() are deferred.
+      Console output stays synchronous so it keeps its order relative to print() calls
     - Consistent Format:
         * File logs: Include timestamp, logger name, level, file location, and message
         * Console logs: Simpler format for readability
@@ -58,13 +165,26 @@ class ProjectLogger:
     - ERROR: A more serious problem
     - CRITICAL: Program may not be able to continue
 
+    Performance:
+    ------------
+
+    - In hot loops, guard expensive debug output with `if logger.isEnabledFor(logging.DEBUG):`.
+      With the root logger and file handler at DEBUG every record is logged, and each one
+      pays for a caller lookup (for %(filename)s:%(lineno)d) and for rendering its message
+    - %-style arguments, e.g. `logger.debug("Fetched %d symbols", n)`, only skip building the
+      message when the level is disabled; under the default configuration they save nothing
+    - Thread and process fields are not collected, as no formatter uses them
+
     You can adjust the logging levels, formats, and file rotation settings in the ProjectLogger class to match your needs. The current setup will create log files with names like project_20250206.log and rotate them when they reach 10MB.
     """
     _instance = None
+    _lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
         
 
@@ -75,47 +195,60 @@ class ProjectLogger:
         Args:
             log_dir (str): Directory to store log files
         """
-        if hasattr(self, 'initialized'):
-            return
-        self.initialized = True
+        with self._lock:
+            # Only the first construction configures logging, even across threads
+            if hasattr(self, 'initialized'):
+                return
+            self.initialized = True
 
-        # Create logs directory if it doesn't exist
-        self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
+            # Create logs directory if it doesn't exist
+            self.log_dir = os.fspath(log_dir)
+            os.makedirs(self.log_dir, exist_ok=True)
         
-        # Create formatters
-        file_formatter = logging.Formatter(
-            '%(asctime)s | %(name)s | %(levelname)s | %(filename)s:%(lineno)d | %(message)s'
-        )
-        console_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)s | %(message)s'
-        )
+            # Create formatters
+            file_formatter = CachedTimeFormatter(
+                '%(asctime)s | %(name)s | %(levelname)s | %(filename)s:%(lineno)d | %(message)s'
+            )
+            console_formatter = CachedTimeFormatter(
+                '%(asctime)s | %(levelname)s | %(message)s'
+            )
         
-        # Create handlers
-        # Rotating file handler - creates new file when size limit is reached
-        file_handler = logging.handlers.RotatingFileHandler(
-            self.log_dir / f"project_{datetime.now().strftime('%Y_%m_%d')}.log",
-            maxBytes=10485760,  # 10MB
-            backupCount=5
-        )
-        file_handler.setFormatter(file_formatter)
-        file_handler.setLevel(logging.DEBUG)
+            # Create handlers
+            # Rotating file handler - creates new file when size limit is reached,
+            # buffers writes and flushes on WARNING and above or every 0.5s
+            file_handler = BufferedRotatingFileHandler(
+                os.path.join(self.log_dir, f"project_{time.strftime('%Y_%m_%d')}.log"),
+                maxBytes=10485760,  # 10MB
+                backupCount=5
+            )
+            file_handler.setFormatter(file_formatter)
+            file_handler.setLevel(logging.DEBUG)
         
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(console_formatter)
-        console_handler.setLevel(logging.INFO)
+            # Console handler
+            console_handler = logging.StreamHandler()
+            console_handler.setFormatter(console_formatter)
+            console_handler.setLevel(logging.INFO)
         
-        # Create root logger
-        self.root_logger = logging.getLogger()
-        self.root_logger.setLevel(logging.DEBUG)
+            # Create root logger
+            self.root_logger = logging.getLogger()
+            self.root_logger.setLevel(logging.DEBUG)
         
-        # Remove any existing handlers
-        self.root_logger.handlers.clear()
+            # Remove any existing handlers
+            self.root_logger.handlers.clear()
         
-        # Add handlers
-        self.root_logger.addHandler(file_handler)
-        self.root_logger.addHandler(console_handler)
+            # Add handlers
+            # File records are enqueued; QueueHandler.prepare still renders the message on
+            # the caller's thread, while a background listener applies the file formatter
+            # and does the write(). The console handler stays on the root logger so that
+            # its output is not reordered against the CLI's own print() calls.
+            self._log_queue = queue.Queue(-1)
+            self.root_logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+            self.root_logger.addHandler(console_handler)
+            self._listener = logging.handlers.QueueListener(
+                self._log_queue, file_handler, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self._listener.stop)
     
     def get_logger(self, name):
         """Get a logger with the specified name.
@@ -130,5 +263,17 @@ class ProjectLogger:
 
 # Default logger instance
 project_logger = ProjectLogger()
-get_logger = project_logger.get_logger
+
+
+@functools.lru_cache(maxsize=None)
+def get_logger(name):
+    """Get a logger with the specified name, memoised to skip the logging manager's lock.
+
+    Args:
+        name (str): Name for the logger, typically __name__
+
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    return project_logger.get_logger(name)
 
@@ -4,7 +4,7 @@ from pathlib import Path
 
 
 # SET PROJECT ROOT
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
 # DATA directories
@@ -0,0 +1,6 @@
+# tests/conftest.py
+import sys
+from pathlib import Path
+
+# Make the `src` and `config` packages importable when pytest is run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
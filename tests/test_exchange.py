@@ -0,0 +1,70 @@
+# tests/test_exchange.py
+import json
+import sys
+import time
+import types
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from src.data_acquisition import exchange as exchange_module
+from src.data_acquisition.exchange import Exchange
+
+DELISTED = "YFPricesMissingError('$%s: possibly delisted; no price data found (period=5d)')"
+
+
+@pytest.fixture
+def raw_data_dir(tmp_path, monkeypatch):
+    """Point the symbol files and the ticker cache at a temporary directory."""
+    monkeypatch.setattr(exchange_module, 'RAW_DATA_DIR', tmp_path)
+    monkeypatch.setattr(exchange_module, '_TICKER_CACHE_FILEPATH', tmp_path / '.ticker_cache.json')
+    monkeypatch.setattr(exchange_module, '_ticker_cache', None)
+    return tmp_path
+
+
+@pytest.fixture
+def exchange():
+    return Exchange(
+        name='TEST',
+        url='https://example.org',
+        table_number=0,
+        pattern_and_replacement=(r'^([A-Z]{1,5})$', r'\1'),
+        column_key='Symbol',
+        filename='symbols_test.csv'
+    )
+
+
+def stub_yfinance(monkeypatch, data, errors):
+    """Install a fake yfinance whose download returns `data` and records `errors`."""
+    shared = types.ModuleType('yfinance.shared')
+    shared._ERRORS = errors
+    yf = types.ModuleType('yfinance')
+    yf.shared = shared
+    yf.download = lambda *args, **kwargs: data
+    monkeypatch.setitem(sys.modules, 'yfinance', yf)
+    monkeypatch.setitem(sys.modules, 'yfinance.shared', shared)
+
+
+def test_download_with_only_delisted_tickers_resolves_them(monkeypatch, exchange):
+    stub_yfinance(monkeypatch, pd.DataFrame(), {t: DELISTED % t for t in ('DEAD1', 'BRK.B')})
+    assert exchange.download_valid_tickers(['DEAD1', 'BRK.B']) == (set(), {'DEAD1', 'BRK.B'})
+
+
+def test_download_without_data_or_not_found_errors_is_unresolved(monkeypatch, exchange):
+    stub_yfinance(monkeypatch, pd.DataFrame(), {'AAPL': "YFRateLimitError('Too Many Requests')"})
+    assert exchange.download_valid_tickers(['AAPL']) is None
+
+
+def test_delisted_tickers_are_cached_alongside_cached_valid_ones(monkeypatch, raw_data_dir, exchange):
+    now = time.time()
+    (raw_data_dir / '.ticker_cache.json').write_text(json.dumps({'AAPL': [True, now], 'MSFT': [True, now]}))
+    stub_yfinance(monkeypatch, pd.DataFrame(), {t: DELISTED % t for t in ('DEAD1', 'BRK.B')})
+
+    symbols = exchange.validate_symbols(['AAPL', 'MSFT', 'DEAD1', 'BRK.B'])
+
+    assert symbols == ['AAPL', 'MSFT', 'invalid_ticker', 'invalid_ticker']
+    cache = json.loads((raw_data_dir / '.ticker_cache.json').read_text())
+    assert cache['DEAD1'][0] is False and cache['BRK.B'][0] is False
+    validated = pd.read_csv(raw_data_dir / exchange.validated_filename)
+    assert validated['Symbol'].tolist() == symbols